@@ -1,4 +1,5 @@
 import streamlit as st
+import pandas as pd
 import os
 import tempfile
 import shutil
@@ -6,25 +7,236 @@ from pathlib import Path
 import traceback
 import time
 import uuid
+import hashlib
+import threading
+import concurrent.futures
+
+import tasks
 
 # Import custom modules
 from modules.video_processor import VideoProcessor
 from modules.transcription import TranscriptionService
 from modules.translation import TranslationService
 from modules.subtitle_handler import SubtitleHandler
-from modules.utils import validate_video_file, cleanup_temp_files, get_video_info
+from modules.utils import (
+    validate_video_file, cleanup_temp_files, get_video_info,
+    file_sha256, sweep_stale_temp_dirs
+)
+from modules.parallel_transcribe import parallel_transcribe
 from modules.database import get_database_manager
 
-# Initialize services
+# Each heavy service loads lazily on first use so e.g. a dashboard-only
+# visit never pays the Whisper model load
+@st.cache_resource
+def get_video_processor():
+    return VideoProcessor()
+
+@st.cache_resource
+def get_transcriber(precision="int8"):
+    return TranscriptionService(precision=precision)
+
+@st.cache_resource
+def get_translator():
+    return TranslationService()
+
+@st.cache_resource
+def get_subtitle_handler():
+    return SubtitleHandler()
+
+# Dashboard queries are staleness-tolerant; serve them from a short-lived
+# cache instead of hitting the database on every widget interaction
+@st.cache_data(ttl=10, show_spinner=False)
+def get_dashboard_stats():
+    return get_database_manager().get_job_statistics()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def get_recent_jobs_cached(limit=5):
+    return get_database_manager().get_recent_jobs(limit=limit)
+
+
+# Pool for speculative audio extraction kicked off at upload time; the
+# workers just babysit ffmpeg subprocesses, and more than one means a
+# single session's extraction can't serialize everyone else's
+_extract_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+
+# Successful runs leave their session dir in place so the static download
+# links and player keep working after the script run ends; the janitor
+# reclaims those dirs once they have been idle past the TTL. Live sessions
+# touch their dir every rerun and the TTL comfortably exceeds the worker
+# timeout below, so only abandoned dirs ever age out.
+_JANITOR_TTL_SECONDS = 3600
+
+
 @st.cache_resource
-def init_services():
-    """Initialize all services with caching"""
-    return {
-        'video_processor': VideoProcessor(),
-        'transcription': TranscriptionService(),
-        'translation': TranslationService(),
-        'subtitle_handler': SubtitleHandler()
-    }
+def _start_janitor():
+    """Periodic sweep of session dirs idle past the TTL (and orphans)"""
+    def _loop():
+        while True:
+            sweep_stale_temp_dirs(max_age_seconds=_JANITOR_TTL_SECONDS)
+            time.sleep(_JANITOR_TTL_SECONDS)
+
+    threading.Thread(target=_loop, daemon=True).start()
+    return True
+
+
+# Worker-queue polling cadence and give-up threshold; polling happens
+# across reruns so the script thread is never parked for the whole job
+_WORKER_POLL_SECONDS = 1.0
+_WORKER_TIMEOUT_SECONDS = 1800
+
+
+def _finish_job(db_manager, data, job_id, start_time, content_hash, input_hash,
+                target_language, segments, srt_path, translated_srt_path,
+                output_path):
+    """Record completion and render the results of a finished job.
+
+    Shared by the inline pipeline and the worker-queue poll path.
+    Returns True so callers can mark the session dir as served.
+    """
+    # Update job completion
+    processing_time = time.time() - start_time
+    db_manager.update_job_status(job_id, 'completed')
+
+    # New job finished: let the dashboard see it right away
+    get_dashboard_stats.clear()
+    get_recent_jobs_cached.clear()
+    db_manager.update_job_metadata(
+        job_id,
+        video_duration=data.get('video_info', {}).get('duration'),
+        video_resolution=f"{data.get('video_info', {}).get('width', 0)}x{data.get('video_info', {}).get('height', 0)}",
+        segments_count=len(segments),
+        processing_time=processing_time,
+        content_hash=content_hash
+    )
+
+    # Persist outputs so identical future jobs can reuse them (the
+    # session dir is reclaimed by the janitor)
+    try:
+        cache_dir = Path("cache") / input_hash
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        cached_paths = {
+            'srt_path': str(shutil.copy(srt_path, cache_dir / srt_path.name))
+        }
+        if translated_srt_path != srt_path:
+            cached_paths['translated_srt_path'] = str(
+                shutil.copy(translated_srt_path, cache_dir / translated_srt_path.name)
+            )
+        if output_path.exists():
+            cached_paths['output_video_path'] = str(
+                shutil.copy(output_path, cache_dir / output_path.name)
+            )
+
+        db_manager.update_job_paths(job_id, **cached_paths)
+    except Exception:
+        pass  # cache population is best-effort
+
+    # Display results
+    st.success("🎉 Video processing completed successfully!")
+    st.info(f"⏱️ Processing took {processing_time:.1f} seconds")
+
+    # Show transcript preview as one widget instead of a message per
+    # segment
+    with st.expander("📜 View Transcript"):
+        preview = "\n".join(
+            f"[{segment['start']:.1f}s - {segment['end']:.1f}s]: {segment['text']}"
+            for segment in segments[:10]
+        )
+        if len(segments) > 10:
+            preview += f"\n... and {len(segments) - 10} more segments"
+        st.code(preview, language=None)
+
+    # Download links, served from the static mount: tornado's
+    # StaticFileHandler pushes the bytes with sendfile(2), so the files
+    # never pass through Python memory
+    download_base = f"app/static/{data['session_id']}"
+
+    col_a, col_b, col_c = st.columns(3)
+
+    with col_a:
+        st.markdown(f"[📄 Download Original SRT]({download_base}/{srt_path.name})")
+
+    with col_b:
+        if target_language != "none":
+            st.markdown(f"[🌍 Download Translated SRT]({download_base}/{translated_srt_path.name})")
+
+    with col_c:
+        if output_path.exists():
+            st.markdown(f"[🎬 Download Video with Subtitles]({download_base}/{output_path.name})")
+
+    # Show processed video
+    if output_path.exists():
+        st.video(os.fspath(output_path))
+
+    return True
+
+
+def _fail_worker_job(db_manager, worker_job, error_message):
+    """Mark a dispatched job failed and release its session dir"""
+    db_manager.update_job_status(worker_job['job_id'], 'failed', error_message)
+    cleanup_temp_files(worker_job['temp_dir'])
+    st.session_state.extract_key = None
+
+
+def _poll_worker_job(db_manager, target_language):
+    """Check on a dispatched worker job once per rerun.
+
+    Each rerun inspects the AsyncResult and either re-schedules itself
+    (bounded by the timeout), reports the failure, or renders the
+    finished job — the script thread never blocks for the job duration.
+    """
+    data = st.session_state.processing_data
+    worker_job = data['worker_job']
+    result = tasks.celery_app.AsyncResult(worker_job['task_id'])
+    elapsed = time.time() - worker_job['start_time']
+
+    if not result.ready():
+        if elapsed > _WORKER_TIMEOUT_SECONDS:
+            data.pop('worker_job', None)
+            _fail_worker_job(db_manager, worker_job, 'Timed out waiting for a worker')
+            st.error("❌ Gave up waiting for the worker pool — is a worker consuming the queue?")
+            return
+
+        # The worker is still writing into the session dir; keep its
+        # mtime fresh so the janitor never reclaims it mid-job
+        try:
+            os.utime(worker_job['temp_dir'])
+        except OSError:
+            pass
+
+        st.info(f"⏳ Processing on worker ({result.state.lower()}, {int(elapsed)}s elapsed)...")
+        time.sleep(_WORKER_POLL_SECONDS)
+        st.rerun()
+
+    data.pop('worker_job', None)
+    try:
+        ctx = result.get()  # re-raises worker-side failures
+    except Exception as e:
+        _fail_worker_job(db_manager, worker_job, str(e))
+        st.error(f"❌ Processing failed: {str(e)}")
+        return
+
+    segments = ctx['segments']
+    db_manager.update_job_paths(
+        worker_job['job_id'],
+        original_video_path=ctx['video_path'],
+        audio_path=ctx['audio_path']
+    )
+
+    if not segments:
+        _fail_worker_job(db_manager, worker_job, 'No speech detected')
+        st.error("❌ No speech detected in the video")
+        return
+
+    _finish_job(
+        db_manager, data, worker_job['job_id'], worker_job['start_time'],
+        worker_job['content_hash'], worker_job['input_hash'], target_language,
+        segments, Path(ctx['srt_path']), Path(ctx['translated_srt_path']),
+        Path(ctx['output_path'])
+    )
+
 
 def main():
     st.set_page_config(
@@ -37,10 +249,9 @@ def main():
     st.title("🎬 YoungKush V.AI - Video Subtitle Generator")
     st.markdown("Upload a video, generate subtitles with AI transcription, and translate them!")
     
-    # Initialize services
-    services = init_services()
+    _start_janitor()
     db_manager = get_database_manager()
-    
+
     # Add database status check
     if db_manager is None:
         st.error("Database connection failed. Some features may not work properly.")
@@ -63,6 +274,13 @@ def main():
             help="Leave as 'none' to skip translation"
         )
         
+        model_precision = st.selectbox(
+            "Whisper Precision",
+            ["int8", "int8_float16", "float16", "float32"],
+            index=0,
+            help="int8 quantization is 2-4x faster with near-identical accuracy"
+        )
+
         # Subtitle styling
         st.subheader("🎨 Subtitle Styling")
         font_size = st.slider("Font Size", 12, 48, 24)
@@ -73,10 +291,22 @@ def main():
         with st.expander("Advanced Options"):
             max_file_size = st.number_input("Max File Size (MB)", 1, 500, 100)
             chunk_length = st.number_input("Audio Chunk Length (seconds)", 10, 60, 30)
+            batch_size = st.number_input(
+                "Whisper Batch Size", 1, 32, 16,
+                help="Number of 30-second windows decoded per model call"
+            )
+            translation_concurrency = st.number_input(
+                "Translation Concurrency", 1, 10, 5,
+                help="Segment batches translated in parallel"
+            )
     
-    # Initialize session state
+    # Initialize session state; the session id is minted once and reused
+    # so the temp dir (and anything keyed on it, like the speculative
+    # extraction future) stays stable across reruns
     if 'processing_data' not in st.session_state:
         st.session_state.processing_data = {}
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex[:8]
     
     # Main content area
     col1, col2 = st.columns([1, 1])
@@ -100,48 +330,82 @@ def main():
                 st.session_state.processing_data = {}
             else:
                 # Display video info
-                file_size = len(uploaded_file.getvalue()) / (1024 * 1024)  # MB
+                file_size = uploaded_file.size / (1024 * 1024)  # MB
                 st.success(f"✅ Video uploaded successfully!")
                 st.info(f"📊 File size: {file_size:.2f} MB")
                 
-                # Create session-specific paths
-                session_id = str(uuid.uuid4())[:8]
-                temp_dir = Path("temp") / session_id
-                temp_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Save uploaded file with safe filename
+                # Session-specific paths under the static root so previews
+                # can be served by URL rather than inlined; the stable
+                # session id keeps these identical on every rerun
+                session_id = st.session_state.session_id
+                temp_dir = Path("static") / session_id
                 safe_name = f"input_{session_id}_{uploaded_file.name}"
                 temp_video_path = temp_dir / safe_name
+
+                # Hoist the conversions that used to happen per use: the
+                # script reruns on every widget interaction
+                video_path_str = os.fspath(temp_video_path)
+                audio_target_str = os.fspath(temp_dir / "audio.wav")
                 
-                # Store in session state for processing
-                st.session_state.processing_data = {
-                    'temp_dir': temp_dir,
-                    'temp_video_path': temp_video_path,
-                    'file_size': file_size,
-                    'session_id': session_id,
-                    'uploaded_file': uploaded_file
-                }
-                
-                # Write file
-                with open(temp_video_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                
-                # Get video information
-                try:
-                    video_info = get_video_info(str(temp_video_path))
-                    if video_info:
-                        st.json({
-                            "Duration": f"{video_info.get('duration', 'Unknown')} seconds",
-                            "Resolution": f"{video_info.get('width', 'Unknown')}x{video_info.get('height', 'Unknown')}",
-                            "FPS": video_info.get('fps', 'Unknown'),
-                            "Format": video_info.get('format', 'Unknown')
-                        })
-                        st.session_state.processing_data['video_info'] = video_info
-                except Exception as e:
-                    st.warning(f"Could not retrieve video info: {str(e)}")
+                # The copy, probe and speculative extraction run once per
+                # upload, not once per rerun
+                upload_key = f"{uploaded_file.name}:{uploaded_file.size}"
+                if (st.session_state.get('extract_key') != upload_key
+                        or not temp_video_path.exists()):
+                    temp_dir.mkdir(parents=True, exist_ok=True)
+                    
+                    # Stream file to disk in 1 MB chunks (avoids buffering
+                    # the whole video in memory)
+                    uploaded_file.seek(0)
+                    with open(temp_video_path, "wb") as f:
+                        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
+                    
+                    # Store in session state for processing
+                    st.session_state.processing_data = {
+                        'temp_dir': temp_dir,
+                        'temp_video_path': temp_video_path,
+                        'file_size': file_size,
+                        'session_id': session_id,
+                        'video_stem': os.path.splitext(uploaded_file.name)[0],
+                        'uploaded_file': uploaded_file
+                    }
+                    
+                    try:
+                        st.session_state.processing_data['video_info'] = get_video_info(video_path_str)
+                    except Exception as e:
+                        st.warning(f"Could not retrieve video info: {str(e)}")
+                    
+                    # Pre-publish: start audio extraction in the background
+                    # now, so the WAV is ready (or in flight) by the time
+                    # the user clicks Start Processing
+                    pending = st.session_state.get('extract_future')
+                    if pending is not None and not pending.done():
+                        pending.cancel()
+
+                    st.session_state.extract_key = upload_key
+                    st.session_state.extract_future = _extract_pool.submit(
+                        get_video_processor().extract_audio,
+                        video_path_str,
+                        audio_target_str
+                    )
+                else:
+                    # Keep the live session's dir out of the janitor's sweep
+                    os.utime(temp_dir)
+
+                # Render video information from the cached probe
+                video_info = st.session_state.processing_data.get('video_info')
+                if video_info:
+                    st.json({
+                        "Duration": f"{video_info.get('duration', 'Unknown')} seconds",
+                        "Resolution": f"{video_info.get('width', 'Unknown')}x{video_info.get('height', 'Unknown')}",
+                        "FPS": video_info.get('fps', 'Unknown'),
+                        "Format": video_info.get('format', 'Unknown')
+                    })
                 
-                # Video preview
-                st.video(str(temp_video_path))
+                # Video preview; st.video treats non-http strings as
+                # filesystem paths, so the app/static URL form only works
+                # in markdown links, not here
+                st.video(video_path_str)
             
     with col2:
         st.header("🎵 Processing")
@@ -149,10 +413,15 @@ def main():
         # Check if we have processing data available
         processing_available = bool(st.session_state.processing_data)
         
-        if processing_available:
+        # A job dispatched to the worker pool is polled once per rerun;
+        # the Start button stays hidden until it resolves
+        if st.session_state.processing_data.get('worker_job'):
+            _poll_worker_job(db_manager, target_language)
+        elif processing_available:
             if st.button("🚀 Start Processing", type="primary"):
                 start_time = time.time()
                 job_id = None
+                served_outputs = False
                 
                 # Get data from session state
                 data = st.session_state.processing_data
@@ -160,8 +429,58 @@ def main():
                 temp_video_path = data['temp_video_path']
                 file_size = data['file_size']
                 uploaded_file = data['uploaded_file']
+
+                # Convert paths once for the whole job
+                video_path_str = os.fspath(temp_video_path)
+                audio_target_str = os.fspath(temp_dir / "audio.wav")
+                video_stem = data.get('video_stem') or os.path.splitext(uploaded_file.name)[0]
                 
                 try:
+                    # Hash the upload once (hashlib.sha256 rides the CPU's
+                    # SHA-NI instructions, so this is nearly free) and reuse
+                    # it for both the dedup record and the output cache key
+                    content_hash = file_sha256(temp_video_path)
+
+                    # Check the output cache: the same video with the same
+                    # settings skips the whole pipeline
+                    param_key = (
+                        f"{content_hash}:{source_language}:{target_language}:"
+                        f"{model_precision}:{chunk_length}:{font_size}:"
+                        f"{font_color}:{outline_color}"
+                    )
+                    input_hash = hashlib.sha256(param_key.encode()).hexdigest()
+
+                    cached_job = db_manager.find_cached_job(input_hash)
+                    if cached_job and Path(cached_job.output_video_path).exists():
+                        srt_path = temp_dir / "subtitles.srt"
+                        shutil.copy(cached_job.srt_path, srt_path)
+
+                        translated_srt_path = srt_path
+                        if cached_job.translated_srt_path and \
+                                cached_job.translated_srt_path != cached_job.srt_path:
+                            translated_srt_path = temp_dir / "subtitles_translated.srt"
+                            shutil.copy(cached_job.translated_srt_path, translated_srt_path)
+
+                        output_path = temp_dir / f"output_{video_stem}_with_subtitles.mp4"
+                        shutil.copy(cached_job.output_video_path, output_path)
+
+                        st.success("🎉 Found a previous run of this exact video and settings — reusing it!")
+
+                        download_base = f"app/static/{data['session_id']}"
+
+                        col_a, col_b, col_c = st.columns(3)
+                        with col_a:
+                            st.markdown(f"[📄 Download Original SRT]({download_base}/{srt_path.name})")
+                        with col_b:
+                            if translated_srt_path != srt_path:
+                                st.markdown(f"[🌍 Download Translated SRT]({download_base}/{translated_srt_path.name})")
+                        with col_c:
+                            st.markdown(f"[🎬 Download Video with Subtitles]({download_base}/{output_path.name})")
+
+                        st.video(os.fspath(output_path))
+                        served_outputs = True
+                        return
+
                     # Create database job record
                     job_id = db_manager.create_video_job(
                         filename=uploaded_file.name,
@@ -170,147 +489,151 @@ def main():
                         target_language=target_language if target_language != "none" else None,
                         font_size=font_size,
                         font_color=font_color,
-                        outline_color=outline_color
+                        outline_color=outline_color,
+                        input_hash=input_hash
                     )
-                    
+
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
                     # Update job status
                     db_manager.update_job_status(job_id, 'processing')
                     
-                    # Step 1: Extract audio
-                    status_text.text("🎵 Extracting audio from video...")
-                    progress_bar.progress(10)
-                    
-                    audio_path = services['video_processor'].extract_audio(
-                        str(temp_video_path),
-                        str(temp_dir / "audio.wav")
-                    )
-                    
-                    # Update database with file paths
-                    db_manager.update_job_paths(
-                        job_id,
-                        original_video_path=str(temp_video_path),
-                        audio_path=audio_path
-                    )
-                    
-                    # Step 2: Transcribe audio
-                    status_text.text("🎤 Transcribing audio with Whisper AI...")
-                    progress_bar.progress(30)
-                    
-                    segments = services['transcription'].transcribe_audio(
-                        audio_path,
-                        language=source_language if source_language != "auto" else None,
-                        chunk_length=chunk_length
-                    )
-                    
-                    if not segments:
-                        st.error("❌ No speech detected in the video")
-                        return
-                    
-                    # Step 3: Generate SRT subtitles
-                    status_text.text("📝 Generating subtitles...")
-                    progress_bar.progress(50)
-                    
-                    srt_content = services['subtitle_handler'].generate_srt(segments)
-                    srt_path = temp_dir / "subtitles.srt"
-                    
-                    with open(srt_path, "w", encoding="utf-8") as f:
-                        f.write(srt_content)
-                    
-                    # Step 4: Translation (if requested)
-                    translated_srt_path = srt_path
-                    if target_language != "none":
-                        status_text.text(f"🌍 Translating to {target_language}...")
-                        progress_bar.progress(70)
-                        
-                        translated_segments = services['translation'].translate_segments(
-                            segments, target_language
+                    output_path = temp_dir / f"output_{video_stem}_with_subtitles.mp4"
+
+                    if tasks.celery_enabled():
+                        # Offload the pipeline to the worker queue; the id
+                        # is stored in session state and polled across
+                        # reruns instead of parking this thread on the job
+                        status_text.text("📨 Queued for processing on worker pool...")
+                        progress_bar.progress(10)
+
+                        result = tasks.run_pipeline(
+                            video_path=video_path_str,
+                            work_dir=str(temp_dir),
+                            language=source_language if source_language != "auto" else None,
+                            target_language=target_language if target_language != "none" else None,
+                            precision=model_precision,
+                            chunk_length=chunk_length,
+                            batch_size=batch_size,
+                            font_size=font_size,
+                            font_color=font_color,
+                            outline_color=outline_color,
+                            output_path=str(output_path)
                         )
-                        
-                        translated_srt = services['subtitle_handler'].generate_srt(translated_segments)
-                        translated_srt_path = temp_dir / "subtitles_translated.srt"
-                        
-                        with open(translated_srt_path, "w", encoding="utf-8") as f:
-                            f.write(translated_srt)
-                    
-                    # Step 5: Generate video with subtitles
-                    status_text.text("🎬 Adding subtitles to video...")
-                    progress_bar.progress(85)
-                    
-                    output_path = temp_dir / f"output_{Path(uploaded_file.name).stem}_with_subtitles.mp4"
-                    
-                    services['video_processor'].add_subtitles_to_video(
-                        str(temp_video_path),
-                        str(translated_srt_path),
-                        str(output_path),
-                        font_size=font_size,
-                        font_color=font_color,
-                        outline_color=outline_color
-                    )
-                    
-                    # Step 6: Complete
-                    status_text.text("✅ Processing complete!")
-                    progress_bar.progress(100)
-                    
-                    # Update job completion
-                    processing_time = time.time() - start_time
-                    db_manager.update_job_status(job_id, 'completed')
-                    db_manager.update_job_metadata(
-                        job_id,
-                        video_duration=data.get('video_info', {}).get('duration'),
-                        video_resolution=f"{data.get('video_info', {}).get('width', 0)}x{data.get('video_info', {}).get('height', 0)}",
-                        segments_count=len(segments),
-                        processing_time=processing_time
-                    )
-                    
-                    # Display results
-                    st.success("🎉 Video processing completed successfully!")
-                    st.info(f"⏱️ Processing took {processing_time:.1f} seconds")
-                    
-                    # Show transcript preview
-                    with st.expander("📜 View Transcript"):
-                        for i, segment in enumerate(segments[:10]):  # Show first 10 segments
-                            st.text(f"[{segment['start']:.1f}s - {segment['end']:.1f}s]: {segment['text']}")
-                        if len(segments) > 10:
-                            st.text(f"... and {len(segments) - 10} more segments")
+                        st.session_state.processing_data['worker_job'] = {
+                            'task_id': result.id,
+                            'job_id': job_id,
+                            'start_time': start_time,
+                            'content_hash': content_hash,
+                            'input_hash': input_hash,
+                            'temp_dir': str(temp_dir)
+                        }
+
+                        # The worker writes into the session dir; keep it
+                        served_outputs = True
+                    else:
+                        # Step 1: Extract audio (usually already running — or
+                        # done — thanks to the pre-publish kick-off at upload)
+                        status_text.text("🎵 Extracting audio from video...")
+                        progress_bar.progress(10)
+
+                        audio_path = None
+                        extract_future = st.session_state.get('extract_future')
+                        if extract_future is not None:
+                            try:
+                                audio_path = extract_future.result()
+                            except Exception:
+                                audio_path = None
+
+                        if audio_path is None:
+                            audio_path = get_video_processor().extract_audio(
+                                video_path_str,
+                                audio_target_str
+                            )
                     
-                    # Download buttons
-                    col_a, col_b, col_c = st.columns(3)
+                        # Update database with file paths
+                        db_manager.update_job_paths(
+                            job_id,
+                            original_video_path=video_path_str,
+                            audio_path=audio_path
+                        )
                     
-                    with col_a:
-                        with open(srt_path, "r", encoding="utf-8") as f:
-                            st.download_button(
-                                "📄 Download Original SRT",
-                                f.read(),
-                                file_name="subtitles.srt",
-                                mime="text/plain"
+                        # Step 2: Transcribe audio (silence-aligned chunks in
+                        # parallel; the module function owns the dispatch,
+                        # offset and overlap-dedup logic)
+                        status_text.text("🎤 Transcribing audio with Whisper AI...")
+                        progress_bar.progress(30)
+
+                        segments = parallel_transcribe(
+                            audio_path,
+                            get_transcriber(model_precision),
+                            language=source_language if source_language != "auto" else None,
+                            chunk_length=chunk_length,
+                            batch_size=batch_size,
+                            max_workers=min(4, os.cpu_count() or 1),
+                            progress_callback=lambda done, total: progress_bar.progress(
+                                30 + int(20 * done / total)
                             )
+                        )
                     
-                    with col_b:
-                        if target_language != "none":
-                            with open(translated_srt_path, "r", encoding="utf-8") as f:
-                                st.download_button(
-                                    "🌍 Download Translated SRT",
-                                    f.read(),
-                                    file_name=f"subtitles_{target_language}.srt",
-                                    mime="text/plain"
-                                )
+                        if not segments:
+                            st.error("❌ No speech detected in the video")
+                            return
                     
-                    with col_c:
-                        if output_path.exists():
-                            with open(output_path, "rb") as f:
-                                st.download_button(
-                                    "🎬 Download Video with Subtitles",
-                                    f.read(),
-                                    file_name=output_path.name,
-                                    mime="video/mp4"
-                                )
+                        # Step 3: Translation (if requested)
+                        translated_segments = None
+                        if target_language != "none":
+                            status_text.text(f"🌍 Translating to {target_language}...")
+                            progress_bar.progress(60)
+
+                            translated_segments = get_translator().translate_segments(
+                                segments, target_language,
+                                max_workers=translation_concurrency
+                            )
+
+                        # Step 4: Generate both SRTs in a single pass over the
+                        # segments (the timestamps are shared)
+                        status_text.text("📝 Generating subtitles...")
+                        progress_bar.progress(70)
+
+                        srt_content, translated_srt = get_subtitle_handler().generate_srt_pair(
+                            segments, translated_segments
+                        )
+
+                        srt_path = temp_dir / "subtitles.srt"
+                        with open(srt_path, "w", encoding="utf-8") as f:
+                            f.write(srt_content)
+
+                        translated_srt_path = srt_path
+                        if translated_srt is not None:
+                            translated_srt_path = temp_dir / "subtitles_translated.srt"
+                            with open(translated_srt_path, "w", encoding="utf-8") as f:
+                                f.write(translated_srt)
                     
-                    # Show processed video
-                    if output_path.exists():
-                        st.video(str(output_path))
+                        # Step 5: Generate video with subtitles
+                        status_text.text("🎬 Adding subtitles to video...")
+                        progress_bar.progress(85)
+
+                        get_video_processor().add_subtitles_to_video(
+                            video_path_str,
+                            os.fspath(translated_srt_path),
+                            os.fspath(output_path),
+                            font_size=font_size,
+                            font_color=font_color,
+                            outline_color=outline_color
+                        )
+
+                        # Step 6: Complete
+                        status_text.text("✅ Processing complete!")
+                        progress_bar.progress(100)
+
+                        served_outputs = _finish_job(
+                            db_manager, data, job_id, start_time,
+                            content_hash, input_hash, target_language,
+                            segments, srt_path, translated_srt_path,
+                            output_path
+                        )
                     
                 except Exception as e:
                     # Update job status to failed
@@ -322,9 +645,20 @@ def main():
                     st.code(traceback.format_exc())
                 
                 finally:
-                    # Cleanup temporary files
-                    if 'temp_dir' in locals():
+                    # Failed runs have nothing worth serving, so their dir
+                    # is trashed immediately; successful runs keep theirs
+                    # alive for the download links until the janitor's TTL
+                    # expires
+                    if not served_outputs:
                         cleanup_temp_files(temp_dir)
+                        # The input file went with the dir; force the next
+                        # rerun to re-stage the upload
+                        st.session_state.extract_key = None
+
+                # Outside the try block so RerunException isn't swallowed
+                # by the failure handler
+                if st.session_state.processing_data.get('worker_job'):
+                    st.rerun()
         else:
             st.info("👆 Please upload a video file to start processing")
     
@@ -336,7 +670,7 @@ def main():
         col_stats1, col_stats2, col_stats3 = st.columns(3)
         
         try:
-            stats = db_manager.get_job_statistics()
+            stats = get_dashboard_stats()
             
             with col_stats1:
                 st.metric("Total Jobs", stats['total_jobs'])
@@ -355,30 +689,26 @@ def main():
             
             # Recent jobs
             with st.expander("📝 Recent Processing Jobs"):
-                recent_jobs = db_manager.get_recent_jobs(limit=5)
+                recent_jobs = get_recent_jobs_cached(limit=5)
                 
                 if recent_jobs:
-                    for job in recent_jobs:
-                        status_emoji = {
-                            'completed': '✅',
-                            'failed': '❌',
-                            'processing': '⏳',
-                            'pending': '⏱️'
-                        }.get(job.status, '❓')
-                        
-                        col_job1, col_job2, col_job3 = st.columns([2, 1, 1])
-                        
-                        with col_job1:
-                            st.text(f"{status_emoji} {job.filename}")
-                        
-                        with col_job2:
-                            st.text(f"{job.status.title()}")
-                        
-                        with col_job3:
-                            if job.processing_time:
-                                st.text(f"{job.processing_time:.1f}s")
-                            else:
-                                st.text("-")
+                    status_emojis = {
+                        'completed': '✅',
+                        'failed': '❌',
+                        'processing': '⏳',
+                        'pending': '⏱️'
+                    }
+
+                    # One dataframe render instead of three widgets per job
+                    jobs_df = pd.DataFrame([
+                        {
+                            'File': f"{status_emojis.get(job.status, '❓')} {job.filename}",
+                            'Status': job.status.title(),
+                            'Time': f"{job.processing_time:.1f}s" if job.processing_time else "-"
+                        }
+                        for job in recent_jobs
+                    ])
+                    st.dataframe(jobs_df, hide_index=True, use_container_width=True)
                 else:
                     st.info("No processing jobs yet")
                     
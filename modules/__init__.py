@@ -0,0 +1 @@
+# Service modules for the video subtitle generator
@@ -0,0 +1,255 @@
+import os
+import json
+from datetime import datetime
+
+# orjson serializes 2-5x faster than stdlib json; the metadata blobs are
+# small, but this path sits on the job-completion critical path
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, desc
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+Base = declarative_base()
+
+
+class VideoJob(Base):
+    """One row per processing job, including paths to its outputs"""
+
+    __tablename__ = 'video_jobs'
+
+    id = Column(Integer, primary_key=True)
+    filename = Column(String(255), nullable=False)
+    file_size = Column(Float)
+    source_language = Column(String(10))
+    target_language = Column(String(10))
+    font_size = Column(Integer)
+    font_color = Column(String(10))
+    outline_color = Column(String(10))
+
+    status = Column(String(20), default='pending')
+    error_message = Column(Text)
+
+    # SHA-256 over the input file plus the processing parameters; used to
+    # find prior completed jobs for identical inputs
+    input_hash = Column(String(64), index=True)
+
+    # SHA-256 of the uploaded file alone, for dedup and abuse tracking
+    content_hash = Column(String(64), index=True)
+
+    original_video_path = Column(Text)
+    audio_path = Column(Text)
+    srt_path = Column(Text)
+    translated_srt_path = Column(Text)
+    output_video_path = Column(Text)
+
+    video_duration = Column(Float)
+    video_resolution = Column(String(20))
+    segments_count = Column(Integer)
+    processing_time = Column(Float)
+    extra_metadata = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime)
+
+
+class DatabaseManager:
+    """Persistence layer for processing jobs and dashboard statistics"""
+
+    # Columns that update_job_metadata may set directly; anything else is
+    # folded into the extra_metadata JSON blob
+    _METADATA_COLUMNS = {
+        'video_duration', 'video_resolution', 'segments_count',
+        'processing_time', 'content_hash'
+    }
+
+    def __init__(self, database_url=None):
+        database_url = database_url or os.environ.get('DATABASE_URL', 'sqlite:///video_jobs.db')
+        self.engine = create_engine(database_url, pool_pre_ping=True)
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    def create_video_job(self, filename, file_size, source_language=None,
+                         target_language=None, font_size=24,
+                         font_color="#FFFFFF", outline_color="#000000",
+                         input_hash=None, status='pending'):
+        """Create a new job record and return its id.
+
+        Callers that start processing immediately can pass
+        status='processing' and skip the follow-up update_job_status
+        round trip.
+        """
+        with self.Session() as session:
+            job = VideoJob(
+                filename=filename,
+                file_size=file_size,
+                source_language=source_language,
+                target_language=target_language,
+                font_size=font_size,
+                font_color=font_color,
+                outline_color=outline_color,
+                input_hash=input_hash,
+                status=status
+            )
+            session.add(job)
+            session.commit()
+            return job.id
+
+    def get_job(self, job_id):
+        """Fetch a single job by id"""
+        with self.Session() as session:
+            return session.get(VideoJob, job_id)
+
+    def update_job_status(self, job_id, status, error_message=None):
+        """Update the status (and optional error message) of a job"""
+        with self.Session() as session:
+            job = session.get(VideoJob, job_id)
+            if job is None:
+                return
+            job.status = status
+            if error_message:
+                job.error_message = error_message
+            if status in ('completed', 'failed'):
+                job.completed_at = datetime.utcnow()
+            session.commit()
+
+    def update_job_paths(self, job_id, **paths):
+        """Record file paths (original video, audio, SRTs, output) for a job"""
+        allowed = {
+            'original_video_path', 'audio_path', 'srt_path',
+            'translated_srt_path', 'output_video_path'
+        }
+        with self.Session() as session:
+            job = session.get(VideoJob, job_id)
+            if job is None:
+                return
+            for key, value in paths.items():
+                if key in allowed and value is not None:
+                    setattr(job, key, value)
+            session.commit()
+
+    def update_job_metadata(self, job_id, **metadata):
+        """Record processing metadata; unknown keys go into extra_metadata"""
+        with self.Session() as session:
+            job = session.get(VideoJob, job_id)
+            if job is None:
+                return
+
+            extra = {}
+            for key, value in metadata.items():
+                if value is None:
+                    continue
+                if key in self._METADATA_COLUMNS and hasattr(job, key):
+                    setattr(job, key, value)
+                else:
+                    extra[key] = value
+
+            if extra:
+                existing = _json_loads(job.extra_metadata) if job.extra_metadata else {}
+                existing.update(extra)
+                job.extra_metadata = _json_dumps(existing)
+
+            session.commit()
+
+    def finalize_job(self, job_id, status, error_message=None, **metadata):
+        """Set the terminal status and metadata of a job in one round trip.
+
+        Combines what update_job_status followed by update_job_metadata
+        would do, but in a single session and UPDATE, halving the DB
+        latency on the job-completion path.
+        """
+        with self.Session() as session:
+            job = session.get(VideoJob, job_id)
+            if job is None:
+                return
+            job.status = status
+            if error_message:
+                job.error_message = error_message
+            if status in ('completed', 'failed'):
+                job.completed_at = datetime.utcnow()
+
+            extra = {}
+            for key, value in metadata.items():
+                if value is None:
+                    continue
+                if key in self._METADATA_COLUMNS and hasattr(job, key):
+                    setattr(job, key, value)
+                else:
+                    extra[key] = value
+
+            if extra:
+                existing = _json_loads(job.extra_metadata) if job.extra_metadata else {}
+                existing.update(extra)
+                job.extra_metadata = _json_dumps(existing)
+
+            session.commit()
+
+    def find_cached_job(self, input_hash):
+        """Find the most recent completed job with the same input hash"""
+        if not input_hash:
+            return None
+        with self.Session() as session:
+            return (
+                session.query(VideoJob)
+                .filter(
+                    VideoJob.input_hash == input_hash,
+                    VideoJob.status == 'completed',
+                    VideoJob.output_video_path.isnot(None)
+                )
+                .order_by(desc(VideoJob.completed_at))
+                .first()
+            )
+
+    def get_job_statistics(self):
+        """Aggregate job counts and timings for the dashboard"""
+        with self.Session() as session:
+            total = session.query(VideoJob).count()
+            completed = session.query(VideoJob).filter(VideoJob.status == 'completed').count()
+            failed = session.query(VideoJob).filter(VideoJob.status == 'failed').count()
+
+            times = [
+                row[0] for row in
+                session.query(VideoJob.processing_time)
+                .filter(VideoJob.processing_time.isnot(None))
+                .all()
+            ]
+
+            return {
+                'total_jobs': total,
+                'completed_jobs': completed,
+                'failed_jobs': failed,
+                'success_rate': (completed / total * 100) if total else 0.0,
+                'average_processing_time': (sum(times) / len(times)) if times else 0.0
+            }
+
+    def get_recent_jobs(self, limit=10):
+        """Return the most recently created jobs, newest first"""
+        with self.Session() as session:
+            return (
+                session.query(VideoJob)
+                .order_by(desc(VideoJob.created_at))
+                .limit(limit)
+                .all()
+            )
+
+
+_db_manager = None
+
+
+def get_database_manager():
+    """Return the shared DatabaseManager, or None if the DB is unreachable"""
+    global _db_manager
+    if _db_manager is None:
+        try:
+            _db_manager = DatabaseManager()
+        except Exception:
+            return None
+    return _db_manager
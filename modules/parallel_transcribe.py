@@ -0,0 +1,89 @@
+import os
+import difflib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from modules.utils import split_audio_on_silence
+
+# Seconds of audio shared between neighbouring chunks so boundary words
+# are transcribed on both sides and can be de-duplicated afterwards
+CHUNK_OVERLAP = 1.0
+
+
+def merge_chunk_segments(chunk_results):
+    """Merge per-chunk segments back into one chronological transcript.
+
+    Segments are re-offset by their chunk origin; where two chunks overlap
+    in time, a duplicated boundary segment is detected by token similarity
+    (difflib on the word sequences) and dropped from the later chunk.
+    """
+    merged = []
+    for offset, segments in sorted(chunk_results, key=lambda item: item[0]):
+        for segment in segments:
+            segment = {
+                **segment,
+                'start': segment['start'] + offset,
+                'end': segment['end'] + offset
+            }
+
+            if merged and segment['start'] < merged[-1]['end'] - 0.05:
+                matcher = difflib.SequenceMatcher(
+                    None,
+                    merged[-1]['text'].lower().split(),
+                    segment['text'].lower().split()
+                )
+                if matcher.ratio() > 0.6:
+                    continue
+
+            merged.append(segment)
+
+    return merged
+
+
+def parallel_transcribe(audio_path, transcription_service, language=None,
+                        chunk_length=30, batch_size=16, max_workers=None,
+                        progress_callback=None):
+    """Transcribe an audio file by silence-split chunks in parallel.
+
+    Chunks run concurrently on a thread pool sharing one model — the
+    inference backend releases the GIL, so threads get real parallelism
+    without pickling the model the way a process pool would require.
+    progress_callback, if given, is called with (done, total) as chunks
+    complete. Returns the merged segment list.
+    """
+    chunks = split_audio_on_silence(
+        audio_path,
+        target_chunks=max_workers or os.cpu_count(),
+        overlap=CHUNK_OVERLAP
+    )
+
+    if len(chunks) == 1:
+        return transcription_service.transcribe_audio(
+            audio_path,
+            language=language,
+            chunk_length=chunk_length,
+            batch_size=batch_size
+        )
+
+    workers = min(len(chunks), max_workers or os.cpu_count() or 1)
+    chunk_results = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                transcription_service.transcribe_audio,
+                chunk_path,
+                language=language,
+                chunk_length=chunk_length,
+                batch_size=batch_size
+            ): offset
+            for chunk_path, offset in chunks
+        }
+
+        done = 0
+        for future in as_completed(futures):
+            chunk_results.append((futures[future], future.result()))
+            done += 1
+            if progress_callback:
+                progress_callback(done, len(futures))
+
+    return merge_chunk_segments(chunk_results)
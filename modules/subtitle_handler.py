@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class SubtitleHandler:
+    """Builds SRT subtitle files from transcription segments"""
+
+    @staticmethod
+    def _format_timestamps(seconds):
+        """Vectorized HH:MM:SS,mmm formatting for an array of seconds.
+
+        One pass of integer ufuncs over all segments replaces the
+        per-segment Python formatting loop.
+        """
+        ms = (np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+
+        hours = ms // 3_600_000
+        minutes = (ms // 60_000) % 60
+        secs = (ms // 1000) % 60
+        millis = ms % 1000
+
+        timestamps = np.char.add(np.char.mod("%02d:", hours), np.char.mod("%02d:", minutes))
+        timestamps = np.char.add(timestamps, np.char.mod("%02d,", secs))
+        return np.char.add(timestamps, np.char.mod("%03d", millis))
+
+    def generate_srt(self, segments):
+        """Generate SRT subtitle content from a list of segment dicts"""
+        if not segments:
+            return ""
+
+        count = len(segments)
+        starts = np.fromiter((seg['start'] for seg in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((seg['end'] for seg in segments), dtype=np.float64, count=count)
+
+        # One stacked pass formats starts and ends together
+        start_stamps, end_stamps = self._format_timestamps(np.stack([starts, ends]))
+
+        blocks = [
+            f"{index}\n{start} --> {end}\n{seg['text'].strip()}\n"
+            for index, (start, end, seg)
+            in enumerate(zip(start_stamps, end_stamps, segments), start=1)
+        ]
+
+        return "\n".join(blocks)
+
+    def generate_srt_pair(self, segments, translated_segments=None):
+        """Generate the original SRT and, optionally, a translated one.
+
+        Translated segments share their timing with the originals, so the
+        index/timestamp headers are formatted once and reused for both
+        outputs instead of running two full generate_srt passes. Returns
+        (original_srt, translated_srt_or_None).
+        """
+        if not segments:
+            return "", "" if translated_segments is not None else None
+
+        count = len(segments)
+        starts = np.fromiter((seg['start'] for seg in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((seg['end'] for seg in segments), dtype=np.float64, count=count)
+
+        start_stamps, end_stamps = self._format_timestamps(np.stack([starts, ends]))
+        headers = [
+            f"{index}\n{start} --> {end}\n"
+            for index, (start, end)
+            in enumerate(zip(start_stamps, end_stamps), start=1)
+        ]
+
+        original = "\n".join(
+            f"{header}{seg['text'].strip()}\n"
+            for header, seg in zip(headers, segments)
+        )
+
+        translated = None
+        if translated_segments is not None:
+            translated = "\n".join(
+                f"{header}{seg['text'].strip()}\n"
+                for header, seg in zip(headers, translated_segments)
+            )
+
+        return original, translated
@@ -0,0 +1,157 @@
+import threading
+
+import numpy as np
+import torch
+
+# Prefer faster-whisper (CTranslate2) when installed; it supports true
+# batched inference over the 30-second mel windows. Fall back to the
+# reference openai-whisper implementation otherwise.
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+import whisper
+
+
+class TranscriptionService:
+    """Speech-to-text service backed by Whisper"""
+
+    def __init__(self, model_size="base", precision="int8", eager=False):
+        """precision maps to the CTranslate2 compute_type: int8 quantized
+        weights halve memory bandwidth and use VNNI/tensor-core int8 GEMMs,
+        typically 2-4x faster than float32 with negligible WER change. The
+        openai-whisper fallback ignores it (fp16 on CUDA, fp32 on CPU).
+
+        With eager=True the weights load at construction time, so a service
+        built inside a cached resource pays the load once per process rather
+        than on the first transcription of every new session.
+        """
+        self.model_size = model_size
+        self.precision = precision
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self._model = None
+        self._batched_model = None
+        self._load_lock = threading.Lock()
+        self._warmed_languages = set()
+        if eager:
+            self._load_model()
+
+    def _load_model(self):
+        """Load the Whisper model on first use.
+
+        Chunked transcription calls this from several pool threads at
+        once; the lock's double-check keeps the first job from
+        constructing redundant models (one full weight load and VRAM
+        spike per thread) when the service was built lazily.
+        """
+        if self._model is not None:
+            return self._model
+
+        with self._load_lock:
+            if self._model is not None:
+                return self._model
+
+            if FASTER_WHISPER_AVAILABLE:
+                # Shard across every visible GPU: faster-whisper keeps one
+                # replica per device_index, so concurrent transcribe calls
+                # run in parallel instead of queueing behind one model
+                if self.device == "cuda":
+                    device_count = torch.cuda.device_count()
+                    device_index = list(range(device_count))
+                    num_workers = device_count
+                else:
+                    device_index = 0
+                    num_workers = 1
+
+                self._batched_model = BatchedInferencePipeline(
+                    model=WhisperModel(
+                        self.model_size,
+                        device=self.device,
+                        device_index=device_index,
+                        num_workers=num_workers,
+                        compute_type=self.precision
+                    )
+                )
+                # Publish last: threads skip the lock once this is set
+                self._model = self._batched_model.model
+            else:
+                self._model = whisper.load_model(self.model_size, device=self.device)
+        return self._model
+
+    def _warm_up(self, language):
+        """Pre-compile the decode path for a fixed source language.
+
+        When the sidebar pins a concrete language, passing it skips the
+        language-detection branch entirely; running one dummy decode on a
+        second of silence warms the CUDA kernels and mel/beam buffers for
+        that language so the first real request doesn't pay compilation
+        cost. Only meaningful for the faster-whisper backend.
+        """
+        if not FASTER_WHISPER_AVAILABLE or not language:
+            return
+        if language in self._warmed_languages:
+            return
+
+        try:
+            segment_iter, _info = self._model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=language
+            )
+            for _segment in segment_iter:
+                pass
+        except Exception:
+            pass
+        self._warmed_languages.add(language)
+
+    def transcribe_audio(self, audio, language=None, chunk_length=30, batch_size=16):
+        """Transcribe audio and return a list of segment dicts.
+
+        audio is either a file path or a 16 kHz mono float32 numpy array;
+        both Whisper backends consume arrays natively, so piped PCM never
+        has to touch the filesystem.
+        Each segment is {'start': float, 'end': float, 'text': str}.
+        With the faster-whisper backend, batch_size > 1 stacks the 30-second
+        windows into a single batched generate call instead of decoding them
+        one at a time. chunk_length is kept for API compatibility; Whisper
+        decodes in fixed 30-second windows internally.
+        """
+        model = self._load_model()
+        self._warm_up(language)
+
+        if FASTER_WHISPER_AVAILABLE:
+            if batch_size > 1:
+                # VAD pre-segmentation drops the silent stretches before
+                # the windows are packed, so each batch is full of speech
+                segment_iter, _info = self._batched_model.transcribe(
+                    audio,
+                    language=language,
+                    batch_size=batch_size,
+                    vad_filter=True
+                )
+            else:
+                segment_iter, _info = model.transcribe(
+                    audio,
+                    language=language
+                )
+
+            return [
+                {'start': seg.start, 'end': seg.end, 'text': seg.text.strip()}
+                for seg in segment_iter
+            ]
+
+        result = model.transcribe(
+            audio,
+            language=language,
+            fp16=(self.device == "cuda")
+        )
+
+        return [
+            {
+                'start': seg['start'],
+                'end': seg['end'],
+                'text': seg['text'].strip()
+            }
+            for seg in result.get('segments', [])
+        ]
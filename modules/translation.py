@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from translate import Translator
+
+
+class TranslationService:
+    """Translation service for subtitle segments"""
+
+    # Segments translated per request batch
+    BATCH_SIZE = 32
+
+    # MyMemory, the translate library's default backend, rejects queries
+    # beyond ~500 characters; joined batches must stay under that or
+    # every batched request fails and degrades to per-text translation
+    MAX_QUERY_CHARS = 450
+
+    def __init__(self, max_workers=5):
+        self.max_workers = max_workers
+        self._translators = {}
+
+    def _get_translator(self, target_language):
+        if target_language not in self._translators:
+            self._translators[target_language] = Translator(to_lang=target_language)
+        return self._translators[target_language]
+
+    def translate_text(self, text, target_language):
+        """Translate a single piece of text"""
+        if not text or not text.strip():
+            return text
+        return self._get_translator(target_language).translate(text)
+
+    def _batch_texts(self, texts, max_batch_size):
+        """Group texts into batches sized for a single backend request.
+
+        Batches are capped both by segment count and by the joined
+        payload length so they fit under MAX_QUERY_CHARS; a single text
+        longer than the budget gets a batch of its own.
+        """
+        batches = []
+        current = []
+        current_len = 0
+        for text in texts:
+            cost = len(text) + 1  # separator
+            if current and (
+                len(current) >= max_batch_size
+                or current_len + cost > self.MAX_QUERY_CHARS
+            ):
+                batches.append(current)
+                current = []
+                current_len = 0
+            current.append(text)
+            current_len += cost
+        if current:
+            batches.append(current)
+        return batches
+
+    def _translate_batch(self, texts, target_language):
+        """Translate a batch of texts in one backend request.
+
+        The texts are joined with newlines and sent as a single payload,
+        so the request round-trip is paid once per batch instead of once
+        per segment. Oversized payloads and batches where the backend
+        does not preserve the line structure fall back to per-text
+        translation.
+        """
+        if len(texts) == 1:
+            return [self.translate_text(texts[0], target_language)]
+
+        payload = "\n".join(text.strip() or " " for text in texts)
+        if len(payload) > self.MAX_QUERY_CHARS:
+            return [self.translate_text(text, target_language) for text in texts]
+        translated = self.translate_text(payload, target_language)
+        lines = translated.split("\n") if translated else []
+        if len(lines) == len(texts):
+            return [line.strip() for line in lines]
+        return [self.translate_text(text, target_language) for text in texts]
+
+    def translate_segments(self, segments, target_language, max_workers=None,
+                           max_batch_size=None):
+        """Translate all segments, preserving their timing fields.
+
+        Segments are grouped into batches of max_batch_size (default
+        BATCH_SIZE), each translated as one request, with the batches in
+        flight concurrently on a bounded thread pool; the translation
+        backend is request-RTT bound, so both levers directly cut wall
+        time. Order is preserved by mapping over the batches in sequence.
+        """
+        if not segments:
+            return segments
+
+        texts = [seg['text'] for seg in segments]
+        batches = self._batch_texts(texts, max_batch_size or self.BATCH_SIZE)
+
+        workers = min(max_workers or self.max_workers, len(batches))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    lambda batch: self._translate_batch(batch, target_language),
+                    batches
+                )
+                translated = [text for batch in results for text in batch]
+        else:
+            translated = [
+                text
+                for batch in batches
+                for text in self._translate_batch(batch, target_language)
+            ]
+
+        return [
+            {**seg, 'text': text}
+            for seg, text in zip(segments, translated)
+        ]
@@ -0,0 +1,268 @@
+import os
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import threading
+import subprocess
+from pathlib import Path
+
+# Session working dirs get renamed in here and deleted by a background
+# thread, so multi-GB cleanups never block the UI
+TRASH_DIR = Path("static") / ".trash"
+
+
+def validate_video_file(uploaded_file, max_size_mb=100):
+    """Validate an uploaded video file against type and size limits"""
+    if uploaded_file is None:
+        return False, "No file uploaded"
+
+    allowed_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv'}
+    extension = Path(uploaded_file.name).suffix.lower()
+
+    if extension not in allowed_extensions:
+        return False, f"Unsupported file type: {extension}"
+
+    file_size_mb = uploaded_file.size / (1024 * 1024)
+    if file_size_mb > max_size_mb:
+        return False, f"File too large: {file_size_mb:.1f}MB exceeds the {max_size_mb}MB limit"
+
+    return True, ""
+
+
+def get_video_info(video_path):
+    """Get basic video metadata (duration, resolution, fps, format) via ffprobe"""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "quiet",
+            "-print_format", "json",
+            "-show_format", "-show_streams",
+            video_path
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    probe = json.loads(result.stdout)
+    info = {}
+
+    format_info = probe.get('format', {})
+    if 'duration' in format_info:
+        info['duration'] = round(float(format_info['duration']), 2)
+    info['format'] = format_info.get('format_name', 'unknown')
+
+    for stream in probe.get('streams', []):
+        if stream.get('codec_type') == 'video':
+            info['width'] = stream.get('width')
+            info['height'] = stream.get('height')
+
+            fps_str = stream.get('r_frame_rate', '0/1')
+            try:
+                num, den = fps_str.split('/')
+                if float(den) > 0:
+                    info['fps'] = round(float(num) / float(den), 2)
+            except (ValueError, ZeroDivisionError):
+                pass
+            break
+
+    return info
+
+
+def get_audio_duration(audio_path):
+    """Get the duration of an audio file in seconds via ffprobe"""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "quiet",
+            "-print_format", "json",
+            "-show_format",
+            audio_path
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    probe = json.loads(result.stdout)
+    return float(probe.get('format', {}).get('duration', 0.0))
+
+
+def silence_split_points(media_path, target_chunks=None, min_chunk_length=60.0,
+                         noise_threshold="-35dB", min_silence_duration=0.4):
+    """Find chunk boundaries (in seconds) aligned to silence.
+
+    Uses ffmpeg's silencedetect filter to find quiet points, then snaps
+    the ideal equal-chunk boundaries to the nearest silence midpoint so
+    no speech is split mid-sentence. Works directly on a video file as
+    well as on audio. Returns a list of boundary times starting at 0.0
+    and ending at the duration; a single-chunk result is [0.0, duration].
+    """
+    if target_chunks is None:
+        target_chunks = os.cpu_count() or 1
+
+    duration = get_audio_duration(media_path)
+
+    # Not worth splitting short audio
+    if target_chunks <= 1 or duration < min_chunk_length * 2:
+        return [0.0, duration]
+
+    target_chunks = min(target_chunks, max(2, int(duration // min_chunk_length)))
+
+    # Detect silence midpoints as candidate cut positions
+    result = subprocess.run(
+        [
+            "ffmpeg", "-i", media_path,
+            "-af", f"silencedetect=noise={noise_threshold}:d={min_silence_duration}",
+            "-f", "null", "-"
+        ],
+        capture_output=True,
+        text=True
+    )
+
+    silence_starts = []
+    silence_ends = []
+    for line in result.stderr.splitlines():
+        if 'silence_start:' in line:
+            silence_starts.append(float(line.split('silence_start:')[1].strip().split()[0]))
+        elif 'silence_end:' in line:
+            silence_ends.append(float(line.split('silence_end:')[1].strip().split()[0]))
+
+    candidates = [
+        (start + end) / 2
+        for start, end in zip(silence_starts, silence_ends)
+        if end > start
+    ]
+
+    # Snap each ideal boundary to the nearest silence midpoint
+    boundaries = [0.0]
+    for i in range(1, target_chunks):
+        ideal = duration * i / target_chunks
+        nearby = [c for c in candidates if abs(c - ideal) < duration / (target_chunks * 2)]
+        cut = min(nearby, key=lambda c: abs(c - ideal)) if nearby else ideal
+        if cut - boundaries[-1] >= 1.0:
+            boundaries.append(cut)
+    boundaries.append(duration)
+
+    return boundaries
+
+
+def split_audio_on_silence(audio_path, target_chunks=None, min_chunk_length=60.0,
+                           noise_threshold="-35dB", min_silence_duration=0.4,
+                           overlap=0.0):
+    """Split an audio file into roughly equal chunks aligned to silence.
+
+    Cuts the file at the boundaries from silence_split_points. A non-zero
+    overlap extends each chunk (except the first) backwards by that many
+    seconds so boundary words appear in both neighbours and can be
+    reconciled after transcription. Returns a list of
+    (chunk_path, start_offset_seconds) tuples; for short files the
+    original path is returned as a single chunk.
+    """
+    boundaries = silence_split_points(
+        audio_path,
+        target_chunks=target_chunks,
+        min_chunk_length=min_chunk_length,
+        noise_threshold=noise_threshold,
+        min_silence_duration=min_silence_duration
+    )
+
+    if len(boundaries) <= 2:
+        return [(audio_path, 0.0)]
+
+    # Cut the chunks (stream copy, no re-encode)
+    audio_path = Path(audio_path)
+    chunks = []
+    for i in range(len(boundaries) - 1):
+        start, end = boundaries[i], boundaries[i + 1]
+        if i > 0 and overlap > 0:
+            start = max(0.0, start - overlap)
+        chunk_path = audio_path.with_name(f"{audio_path.stem}_chunk{i:03d}{audio_path.suffix}")
+        subprocess.run(
+            [
+                "ffmpeg", "-y", "-v", "quiet",
+                "-ss", f"{start:.3f}", "-to", f"{end:.3f}",
+                "-i", str(audio_path),
+                "-c", "copy",
+                str(chunk_path)
+            ],
+            check=True
+        )
+        chunks.append((str(chunk_path), start))
+
+    return chunks
+
+
+def file_sha256(path, bufsize=1 << 20):
+    """SHA-256 of a file, streamed in 1 MB chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(bufsize):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_duration(seconds):
+    """Format a duration in seconds as a human-readable string"""
+    if seconds is None:
+        return "Unknown"
+
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    if hours:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def cleanup_temp_files(temp_dir):
+    """Remove a temporary working directory without blocking the caller.
+
+    The directory is renamed into the trash (an O(1) operation on the
+    same filesystem) and the actual unlink storm runs on a daemon thread.
+    """
+    try:
+        temp_dir = Path(temp_dir)
+        if not temp_dir.exists():
+            return
+
+        TRASH_DIR.mkdir(parents=True, exist_ok=True)
+        trash_path = TRASH_DIR / f"{temp_dir.name}_{uuid.uuid4().hex[:8]}"
+        shutil.move(str(temp_dir), str(trash_path))
+
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_path,),
+            kwargs={'ignore_errors': True},
+            daemon=True
+        ).start()
+    except Exception:
+        pass
+
+
+def sweep_stale_temp_dirs(root="static", max_age_seconds=3600):
+    """Delete leftover session dirs (and trash) older than max_age.
+
+    Run once at app startup to catch directories orphaned by crashed or
+    interrupted sessions.
+    """
+    root = Path(root)
+    if not root.exists():
+        return
+
+    now = time.time()
+    candidates = list(root.iterdir())
+    if TRASH_DIR.exists():
+        candidates.extend(TRASH_DIR.iterdir())
+
+    for entry in candidates:
+        if not entry.is_dir() or entry == TRASH_DIR:
+            continue
+        try:
+            if now - entry.stat().st_mtime > max_age_seconds:
+                shutil.rmtree(entry, ignore_errors=True)
+        except OSError:
+            continue
@@ -1,42 +1,339 @@
 import streamlit as st
+import pandas as pd
 import os
+import asyncio
 import tempfile
 import shutil
 from pathlib import Path
+from functools import partial
 import traceback
 import time
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import custom modules
-from modules.video_processor import VideoProcessor
+from modules.video_processor import VideoProcessor, AUDIO_SAMPLE_RATE
 from modules.transcription import TranscriptionService
 from modules.translation import TranslationService
 from modules.subtitle_handler import SubtitleHandler
-from modules.utils import get_video_info, format_duration
+from modules.utils import get_video_info, format_duration, cleanup_temp_files, sweep_stale_temp_dirs
+from modules.parallel_transcribe import CHUNK_OVERLAP, merge_chunk_segments
+from modules.utils import silence_split_points
 from modules.database import get_database_manager
 
 # Initialize services
 @st.cache_resource
-def init_services():
-    """Initialize all services with caching"""
+def init_services(compute_type="int8"):
+    """Initialize all services with caching.
+
+    The Whisper model loads eagerly here so the weights live in the
+    cached resource and survive reruns; without this, every new session
+    would reload them on its first transcription call. Runs once per
+    process, so it also sweeps temp dirs orphaned by crashed sessions.
+    """
+    sweep_stale_temp_dirs(root="temp")
     return {
         'video_processor': VideoProcessor(),
-        'transcription': TranscriptionService(),
+        'transcription': TranscriptionService(precision=compute_type, eager=True),
         'translation': TranslationService(),
         'subtitle_handler': SubtitleHandler()
     }
 
-def validate_file_simple(file_data, max_size_mb=100):
-    """Simple file validation"""
-    if not file_data:
+@st.cache_data(ttl=10)
+def get_dashboard_stats():
+    """Dashboard statistics, served from cache between reruns.
+
+    Every widget interaction reruns the script; a 10-second TTL keeps
+    the dashboard off the database for those reruns, and the cache is
+    cleared explicitly when a job finishes so fresh results show up
+    immediately.
+    """
+    return get_database_manager().get_job_statistics()
+
+
+@st.cache_data(ttl=10)
+def get_recent_jobs_cached(limit):
+    """Recent jobs for the dashboard, cached like get_dashboard_stats"""
+    return get_database_manager().get_recent_jobs(limit=limit)
+
+
+def validate_file_simple(file_size, max_size_mb=100):
+    """Simple file validation against a size limit (bytes in, not data)"""
+    if not file_size:
         return False, "No file data"
     
-    file_size_mb = len(file_data) / (1024 * 1024)
+    file_size_mb = file_size / (1024 * 1024)
     if file_size_mb > max_size_mb:
         return False, f"File too large: {file_size_mb:.1f}MB > {max_size_mb}MB"
     
     return True, f"File size: {file_size_mb:.1f}MB"
 
+async def _extract_chunks(services, video_path, config, status, progress, loop):
+    """Extract PCM and slice it into silence-aligned transcription chunks.
+
+    The PCM is piped straight from ffmpeg into a numpy array, never
+    touching disk, and chunks are array slices rather than re-cut files.
+    Returns a list of (chunk_audio, start_offset) tuples.
+    """
+    status("🎵 Extracting audio from video...")
+    progress(10)
+
+    audio = await loop.run_in_executor(
+        None,
+        services['video_processor'].extract_audio,
+        video_path
+    )
+
+    boundaries = await loop.run_in_executor(
+        None,
+        partial(
+            silence_split_points,
+            video_path,
+            target_chunks=os.cpu_count()
+        )
+    )
+
+    chunks = []
+    for i in range(len(boundaries) - 1):
+        start, end = boundaries[i], boundaries[i + 1]
+        if i > 0:
+            start = max(0.0, start - CHUNK_OVERLAP)
+        chunk_audio = audio[int(start * AUDIO_SAMPLE_RATE):int(end * AUDIO_SAMPLE_RATE)]
+        chunks.append((chunk_audio, start))
+
+    return chunks
+
+
+async def _burn_subtitles(services, video_path, srt_path, output_path, config, loop):
+    """Burn the given SRT into the video on the executor"""
+    await loop.run_in_executor(
+        None,
+        partial(
+            services['video_processor'].add_subtitles_to_video,
+            video_path,
+            str(srt_path),
+            str(output_path),
+            font_size=config['font_size'],
+            font_color=config['font_color'],
+            outline_color=config['outline_color']
+        )
+    )
+
+
+async def run_pipeline(services, video_path, temp_dir, config, status, progress):
+    """Dispatch one job to the pipeline specialized for its configuration.
+
+    Transcribe-only and transcribe+translate are separate coroutines
+    instead of one function re-testing the target language at every
+    stage: the plain path has no translation queue, no second SRT and no
+    per-chunk branches at all, while the translating path keeps the full
+    producer/consumer overlap.
+    """
+    if config['target_language']:
+        return await _run_transcribe_translate(
+            services, video_path, temp_dir, config, status, progress
+        )
+    return await _run_transcribe_only(
+        services, video_path, temp_dir, config, status, progress
+    )
+
+
+async def _run_transcribe_only(services, video_path, temp_dir, config, status, progress):
+    """Straight-line pipeline for jobs without translation"""
+    loop = asyncio.get_running_loop()
+    language = config['language']
+
+    chunks = await _extract_chunks(services, video_path, config, status, progress, loop)
+
+    async def transcribe_chunk(chunk_audio, offset):
+        segments = await loop.run_in_executor(
+            None,
+            partial(
+                services['transcription'].transcribe_audio,
+                chunk_audio,
+                language=language,
+                chunk_length=config['chunk_length'],
+                batch_size=config['batch_size']
+            )
+        )
+        return offset, segments
+
+    status("🎤 Transcribing audio with Whisper AI...")
+    progress(30)
+
+    chunk_results = []
+    for completed in asyncio.as_completed(
+        [transcribe_chunk(chunk_audio, offset) for chunk_audio, offset in chunks]
+    ):
+        chunk_results.append(await completed)
+        progress(30 + int(30 * len(chunk_results) / len(chunks)))
+
+    merged = merge_chunk_segments(chunk_results)
+    segments = [
+        {'start': seg['start'], 'end': seg['end'], 'text': seg['text']}
+        for seg in merged
+    ]
+
+    result = {
+        'segments': segments,
+        'srt_path': None,
+        'translated_srt_path': None,
+        'output_path': None
+    }
+    if not segments:
+        return result
+
+    status("📝 Generating subtitles...")
+    progress(60)
+
+    srt_path = temp_dir / "subtitles.srt"
+    with open(srt_path, "w", encoding="utf-8") as f:
+        f.write(services['subtitle_handler'].generate_srt(segments))
+
+    status("🎬 Adding subtitles to video...")
+    progress(85)
+
+    output_path = temp_dir / config['output_name']
+    await _burn_subtitles(services, video_path, srt_path, output_path, config, loop)
+
+    result.update(
+        srt_path=srt_path,
+        translated_srt_path=srt_path,
+        output_path=output_path
+    )
+    return result
+
+
+async def _run_transcribe_translate(services, video_path, temp_dir, config, status, progress):
+    """Queue-based pipeline for jobs that translate.
+
+    The stages communicate through queues: transcribed chunks flow into
+    translation while later chunks are still decoding, so translation of
+    chunk K overlaps transcription of chunk K+1 and wall time approaches
+    the slowest stage instead of the sum of all stages.
+    """
+    loop = asyncio.get_running_loop()
+    text_queue = asyncio.Queue()
+    srt_queue = asyncio.Queue()
+
+    language = config['language']
+    target_language = config['target_language']
+
+    chunks = await _extract_chunks(services, video_path, config, status, progress, loop)
+
+    async def transcribe_chunk(chunk_audio, offset):
+        segments = await loop.run_in_executor(
+            None,
+            partial(
+                services['transcription'].transcribe_audio,
+                chunk_audio,
+                language=language,
+                chunk_length=config['chunk_length'],
+                batch_size=config['batch_size']
+            )
+        )
+        return offset, segments
+
+    async def stt_worker():
+        status("🎤 Transcribing audio with Whisper AI...")
+        progress(30)
+
+        done = 0
+        for completed in asyncio.as_completed(
+            [transcribe_chunk(chunk_audio, offset) for chunk_audio, offset in chunks]
+        ):
+            await text_queue.put(await completed)
+            done += 1
+            progress(30 + int(20 * done / len(chunks)))
+
+        await text_queue.put(None)
+
+    async def mt_worker():
+        while (item := await text_queue.get()) is not None:
+            offset, segments = item
+            if segments:
+                status(f"🌍 Translating to {target_language}...")
+                translated = await loop.run_in_executor(
+                    None,
+                    partial(
+                        services['translation'].translate_segments,
+                        segments,
+                        target_language,
+                        max_batch_size=config['translation_batch']
+                    )
+                )
+                for segment, translation in zip(segments, translated):
+                    segment['translated_text'] = translation['text']
+            await srt_queue.put((offset, segments))
+        await srt_queue.put(None)
+
+    async def collect_worker():
+        results = []
+        while (item := await srt_queue.get()) is not None:
+            results.append(item)
+        return results
+
+    _, _, chunk_results = await asyncio.gather(stt_worker(), mt_worker(), collect_worker())
+    merged = merge_chunk_segments(chunk_results)
+
+    segments = [
+        {'start': seg['start'], 'end': seg['end'], 'text': seg['text']}
+        for seg in merged
+    ]
+
+    result = {
+        'segments': segments,
+        'srt_path': None,
+        'translated_srt_path': None,
+        'output_path': None
+    }
+    if not segments:
+        return result
+
+    translated_segments = [
+        {'start': seg['start'], 'end': seg['end'], 'text': seg.get('translated_text', seg['text'])}
+        for seg in merged
+    ]
+
+    status("📝 Generating subtitles...")
+    progress(60)
+
+    srt_path = None
+    if config['keep_original']:
+        srt_content, translated_srt = services['subtitle_handler'].generate_srt_pair(
+            segments, translated_segments
+        )
+        srt_path = temp_dir / "subtitles.srt"
+        with open(srt_path, "w", encoding="utf-8") as f:
+            f.write(srt_content)
+    else:
+        # Only the translated output is wanted: skip the original SRT's
+        # generate pass and disk write entirely
+        translated_srt = services['subtitle_handler'].generate_srt(translated_segments)
+
+    translated_srt_path = temp_dir / "subtitles_translated.srt"
+    with open(translated_srt_path, "w", encoding="utf-8") as f:
+        f.write(translated_srt)
+
+    status("🎬 Adding subtitles to video...")
+    progress(85)
+
+    output_path = temp_dir / config['output_name']
+    await _burn_subtitles(services, video_path, translated_srt_path, output_path, config, loop)
+
+    result.update(
+        srt_path=srt_path,
+        translated_srt_path=translated_srt_path,
+        output_path=output_path
+    )
+    return result
+
+
 def main():
     st.set_page_config(
         page_title="YoungKush V.AI - Video Subtitle Generator",
@@ -47,8 +344,7 @@ def main():
     st.title("🎬 YoungKush V.AI - Video Subtitle Generator")
     st.markdown("Upload a video, generate subtitles with AI transcription, and translate them!")
     
-    # Initialize services and database
-    services = init_services()
+    # Initialize database
     db_manager = get_database_manager()
     
     if db_manager is None:
@@ -70,6 +366,11 @@ def main():
             help="Leave as 'none' to skip translation"
         )
         
+        keep_original = st.checkbox(
+            "Keep original SRT", value=True,
+            help="When translating, also generate the untranslated subtitles"
+        )
+        
         st.subheader("🎨 Subtitle Styling")
         font_size = st.slider("Font Size", 12, 48, 24)
         font_color = st.color_picker("Font Color", "#FFFFFF")
@@ -78,6 +379,23 @@ def main():
         with st.expander("Advanced Options"):
             max_file_size = st.number_input("Max File Size (MB)", 1, 100, 50)
             chunk_length = st.number_input("Audio Chunk Length (seconds)", 10, 60, 30)
+            batch_size = st.slider(
+                "Whisper Batch Size", 1, 32, 16,
+                help="VAD-packed 30-second windows decoded per model call"
+            )
+            translation_batch = st.slider(
+                "Translation Batch Size", 1, 64, 32,
+                help="Segments translated per backend request"
+            )
+            compute_type = st.selectbox(
+                "Compute Type",
+                ["int8", "int8_float16", "float16", "float32"],
+                help="CTranslate2 quantization; int8 halves memory bandwidth"
+            )
+    
+    # Services load after the sidebar so the chosen compute type reaches
+    # the model constructor
+    services = init_services(compute_type)
     
     # Main content area
     col1, col2 = st.columns([1, 1])
@@ -93,11 +411,14 @@ def main():
         )
         
         if uploaded_file is not None:
-            # Get file data
-            file_data = uploaded_file.getvalue()
+            # Size without reading the data: the upload stays in
+            # Streamlit's tempfile-backed buffer until processing starts
+            uploaded_file.seek(0, 2)
+            file_size = uploaded_file.tell()
+            uploaded_file.seek(0)
             
             # Validate
-            is_valid, msg = validate_file_simple(file_data, max_file_size)
+            is_valid, msg = validate_file_simple(file_size, max_file_size)
             
             if not is_valid:
                 st.error(f"❌ {msg}")
@@ -105,27 +426,38 @@ def main():
                 st.success(f"✅ Video uploaded successfully!")
                 st.info(f"📊 {msg}")
                 
-                # Store file in session state for processing
-                if 'video_data' not in st.session_state:
-                    st.session_state.video_data = {}
+                size_mb = file_size / (1024 * 1024)
                 
+                # Store only metadata in session state; keeping the raw
+                # bytes here would pin a full video copy in the session heap
                 st.session_state.video_data = {
-                    'file_data': file_data,
                     'filename': uploaded_file.name,
+                    'size_mb': size_mb,
                     'ready': True
                 }
                 
-                # Show file info
-                st.json({
+                # Show file info; orjson serializes in one C pass where
+                # st.json would go through stdlib json
+                file_info = {
                     "Filename": uploaded_file.name,
-                    "Size": f"{len(file_data) / (1024*1024):.1f} MB",
+                    "Size": f"{size_mb:.1f} MB",
                     "Type": uploaded_file.type or "video"
-                })
+                }
+                if ORJSON_AVAILABLE:
+                    st.code(
+                        orjson.dumps(file_info, option=orjson.OPT_INDENT_2).decode(),
+                        language="json"
+                    )
+                else:
+                    st.json(file_info)
     
     with col2:
         st.header("🎵 Processing")
         
-        if 'video_data' in st.session_state and st.session_state.video_data.get('ready'):
+        # Session state outlives the uploader widget, so the 'ready' flag
+        # alone is stale once the user clears the upload — the handler
+        # streams from uploaded_file and needs it present
+        if uploaded_file is not None and st.session_state.get('video_data', {}).get('ready'):
             if st.button("🚀 Start Processing", type="primary"):
                 
                 # Create temporary workspace
@@ -137,94 +469,62 @@ def main():
                 job_id = None
                 
                 try:
-                    # Save uploaded file
+                    # Stream the upload straight to disk in 1 MB blocks
                     video_data = st.session_state.video_data
                     temp_video_path = temp_dir / f"input_{video_data['filename']}"
                     
+                    uploaded_file.seek(0)
                     with open(temp_video_path, "wb") as f:
-                        f.write(video_data['file_data'])
+                        shutil.copyfileobj(uploaded_file, f, 1 << 20)
                     
                     # Create database job if available
                     if db_manager:
                         job_id = db_manager.create_video_job(
                             filename=video_data['filename'],
-                            file_size=len(video_data['file_data']) / (1024*1024),
+                            file_size=video_data['size_mb'],
                             source_language=source_language if source_language != "auto" else None,
                             target_language=target_language if target_language != "none" else None,
                             font_size=font_size,
                             font_color=font_color,
-                            outline_color=outline_color
+                            outline_color=outline_color,
+                            status='processing'
                         )
-                        db_manager.update_job_status(job_id, 'processing')
                     
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    # Step 1: Extract audio
-                    status_text.text("🎵 Extracting audio from video...")
-                    progress_bar.progress(10)
-                    
-                    audio_path = services['video_processor'].extract_audio(
+                    # Steps 1-5 run as an asyncio pipeline, dispatched once
+                    # to the path specialized for this job's configuration
+                    pipeline_result = asyncio.run(run_pipeline(
+                        services,
                         str(temp_video_path),
-                        str(temp_dir / "audio.wav")
-                    )
-                    
-                    # Step 2: Transcribe audio
-                    status_text.text("🎤 Transcribing audio with Whisper AI...")
-                    progress_bar.progress(30)
-                    
-                    segments = services['transcription'].transcribe_audio(
-                        audio_path,
-                        language=source_language if source_language != "auto" else None,
-                        chunk_length=chunk_length
-                    )
-                    
+                        temp_dir,
+                        {
+                            'language': source_language if source_language != "auto" else None,
+                            'target_language': target_language if target_language != "none" else None,
+                            'chunk_length': chunk_length,
+                            'batch_size': batch_size,
+                            'translation_batch': translation_batch,
+                            'keep_original': keep_original,
+                            'font_size': font_size,
+                            'font_color': font_color,
+                            'outline_color': outline_color,
+                            'output_name': f"output_{Path(video_data['filename']).stem}_with_subtitles.mp4"
+                        },
+                        status_text.text,
+                        progress_bar.progress
+                    ))
+
+                    segments = pipeline_result['segments']
                     if not segments:
                         st.error("❌ No speech detected in the video")
                         if db_manager and job_id:
-                            db_manager.update_job_status(job_id, 'failed', 'No speech detected')
+                            db_manager.finalize_job(job_id, 'failed', 'No speech detected')
                         return
-                    
-                    # Step 3: Generate SRT subtitles
-                    status_text.text("📝 Generating subtitles...")
-                    progress_bar.progress(50)
-                    
-                    srt_content = services['subtitle_handler'].generate_srt(segments)
-                    srt_path = temp_dir / "subtitles.srt"
-                    
-                    with open(srt_path, "w", encoding="utf-8") as f:
-                        f.write(srt_content)
-                    
-                    # Step 4: Translation (if requested)
-                    translated_srt_path = srt_path
-                    if target_language != "none":
-                        status_text.text(f"🌍 Translating to {target_language}...")
-                        progress_bar.progress(70)
-                        
-                        translated_segments = services['translation'].translate_segments(
-                            segments, target_language
-                        )
-                        
-                        translated_srt = services['subtitle_handler'].generate_srt(translated_segments)
-                        translated_srt_path = temp_dir / "subtitles_translated.srt"
-                        
-                        with open(translated_srt_path, "w", encoding="utf-8") as f:
-                            f.write(translated_srt)
-                    
-                    # Step 5: Generate video with subtitles
-                    status_text.text("🎬 Adding subtitles to video...")
-                    progress_bar.progress(85)
-                    
-                    output_path = temp_dir / f"output_{Path(video_data['filename']).stem}_with_subtitles.mp4"
-                    
-                    services['video_processor'].add_subtitles_to_video(
-                        str(temp_video_path),
-                        str(translated_srt_path),
-                        str(output_path),
-                        font_size=font_size,
-                        font_color=font_color,
-                        outline_color=outline_color
-                    )
+
+                    srt_path = pipeline_result['srt_path']
+                    translated_srt_path = pipeline_result['translated_srt_path']
+                    output_path = pipeline_result['output_path']
                     
                     # Step 6: Complete
                     status_text.text("✅ Processing complete!")
@@ -232,77 +532,87 @@ def main():
                     
                     processing_time = time.time() - start_time
                     
-                    # Update database
+                    # Status and metadata land in one UPDATE
                     if db_manager and job_id:
-                        db_manager.update_job_status(job_id, 'completed')
-                        db_manager.update_job_metadata(
+                        db_manager.finalize_job(
                             job_id,
+                            'completed',
                             segments_count=len(segments),
                             processing_time=processing_time
                         )
+                        get_dashboard_stats.clear()
+                        get_recent_jobs_cached.clear()
                     
                     st.success("🎉 Video processing completed successfully!")
                     st.info(f"⏱️ Processing took {processing_time:.1f} seconds")
                     
-                    # Show transcript preview
+                    # Show transcript preview as one widget rather than
+                    # one widget round-trip per segment
                     with st.expander("📜 View Transcript"):
-                        for i, segment in enumerate(segments[:10]):
-                            st.text(f"[{segment['start']:.1f}s - {segment['end']:.1f}s]: {segment['text']}")
+                        preview = "\n".join(
+                            f"[{seg['start']:.1f}s - {seg['end']:.1f}s]: {seg['text']}"
+                            for seg in segments[:10]
+                        )
                         if len(segments) > 10:
-                            st.text(f"... and {len(segments) - 10} more segments")
+                            preview += f"\n... and {len(segments) - 10} more segments"
+                        st.code(preview, language=None)
+                    
+                    # Read the MP4 once and share the bytes between the
+                    # download button and the player; Streamlit's media
+                    # marshalling only accepts str/bytes/BytesIO-style
+                    # objects (an mmap would raise at render time), and it
+                    # dedups identical bytes in its media storage, so this
+                    # is one copy, not two
+                    output_bytes = output_path.read_bytes() if output_path.exists() else None
                     
                     # Download buttons
                     col_a, col_b, col_c = st.columns(3)
                     
                     with col_a:
-                        with open(srt_path, "r", encoding="utf-8") as f:
+                        if srt_path is not None:
                             st.download_button(
                                 "📄 Download Original SRT",
-                                f.read(),
+                                srt_path.read_bytes(),
                                 file_name="subtitles.srt",
                                 mime="text/plain"
                             )
                     
                     with col_b:
                         if target_language != "none":
-                            with open(translated_srt_path, "r", encoding="utf-8") as f:
-                                st.download_button(
-                                    "🌍 Download Translated SRT",
-                                    f.read(),
-                                    file_name=f"subtitles_{target_language}.srt",
-                                    mime="text/plain"
-                                )
+                            st.download_button(
+                                "🌍 Download Translated SRT",
+                                translated_srt_path.read_bytes(),
+                                file_name=f"subtitles_{target_language}.srt",
+                                mime="text/plain"
+                            )
                     
                     with col_c:
-                        if output_path.exists():
-                            with open(output_path, "rb") as f:
-                                st.download_button(
-                                    "🎬 Download Video with Subtitles",
-                                    f.read(),
-                                    file_name=output_path.name,
-                                    mime="video/mp4"
-                                )
+                        if output_bytes is not None:
+                            st.download_button(
+                                "🎬 Download Video with Subtitles",
+                                output_bytes,
+                                file_name=output_path.name,
+                                mime="video/mp4"
+                            )
                     
                     # Show processed video
-                    if output_path.exists():
-                        st.video(str(output_path))
+                    if output_bytes is not None:
+                        st.video(output_bytes)
                 
                 except Exception as e:
                     # Update job status to failed
                     if db_manager and job_id:
-                        db_manager.update_job_status(job_id, 'failed', str(e))
+                        db_manager.finalize_job(job_id, 'failed', str(e))
                     
                     st.error(f"❌ Processing failed: {str(e)}")
                     st.error("🔍 Error details:")
                     st.code(traceback.format_exc())
                 
                 finally:
-                    # Cleanup
-                    try:
-                        if temp_dir.exists():
-                            shutil.rmtree(temp_dir)
-                    except Exception as e:
-                        st.warning(f"Could not clean up temporary files: {str(e)}")
+                    # Rename-to-trash with the unlink storm on a daemon
+                    # thread; the script thread never blocks on deletion,
+                    # and the download buttons already hold their bytes
+                    cleanup_temp_files(temp_dir)
         else:
             st.info("👆 Please upload a video file to start processing")
     
@@ -312,7 +622,7 @@ def main():
         st.header("📊 Processing Dashboard")
         
         try:
-            stats = db_manager.get_job_statistics()
+            stats = get_dashboard_stats()
             
             col_stats1, col_stats2, col_stats3 = st.columns(3)
             
@@ -331,32 +641,27 @@ def main():
                 else:
                     st.metric("Avg Processing Time", "N/A")
             
-            # Recent jobs
+            # Recent jobs as one dataframe instead of three columns of
+            # st.text widgets per row
             with st.expander("📝 Recent Processing Jobs"):
-                recent_jobs = db_manager.get_recent_jobs(limit=5)
+                recent_jobs = get_recent_jobs_cached(limit=5)
                 
                 if recent_jobs:
-                    for job in recent_jobs:
-                        status_emoji = {
-                            'completed': '✅',
-                            'failed': '❌',
-                            'processing': '⏳',
-                            'pending': '⏱️'
-                        }.get(job.status, '❓')
-                        
-                        col_job1, col_job2, col_job3 = st.columns([2, 1, 1])
-                        
-                        with col_job1:
-                            st.text(f"{status_emoji} {job.filename}")
-                        
-                        with col_job2:
-                            st.text(f"{job.status.title()}")
-                        
-                        with col_job3:
-                            if hasattr(job, 'processing_time') and job.processing_time:
-                                st.text(f"{job.processing_time:.1f}s")
-                            else:
-                                st.text("-")
+                    status_emojis = {
+                        'completed': '✅',
+                        'failed': '❌',
+                        'processing': '⏳',
+                        'pending': '⏱️'
+                    }
+                    jobs_df = pd.DataFrame([
+                        {
+                            'File': f"{status_emojis.get(job.status, '❓')} {job.filename}",
+                            'Status': job.status.title(),
+                            'Time': f"{job.processing_time:.1f}s" if job.processing_time else "-"
+                        }
+                        for job in recent_jobs
+                    ])
+                    st.dataframe(jobs_df, hide_index=True, use_container_width=True)
                 else:
                     st.info("No processing jobs yet")
                     
@@ -0,0 +1,139 @@
+"""Celery tasks for the video subtitle pipeline.
+
+The four pipeline stages (audio extraction, transcription, translation +
+SRT generation, subtitle burn-in) are wrapped as tasks chained per job so
+the Streamlit UI only dispatches and polls instead of blocking a rerun
+for minutes. Transcription is routed to its own queue so it can be pinned
+to GPU workers while the ffmpeg stages run on CPU workers:
+
+    celery -A tasks worker --queues=cpu
+    celery -A tasks worker --queues=gpu --concurrency=1
+
+Dispatching is enabled by setting CELERY_BROKER_URL; without it the app
+falls back to running the pipeline inline.
+"""
+
+import os
+from pathlib import Path
+
+from celery import Celery, chain
+
+BROKER_URL = os.environ.get("CELERY_BROKER_URL")
+TRANSCRIPTION_QUEUE = os.environ.get("TRANSCRIPTION_QUEUE", "gpu")
+DEFAULT_QUEUE = os.environ.get("FFMPEG_QUEUE", "cpu")
+
+celery_app = Celery(
+    "whisper_video",
+    broker=BROKER_URL or "redis://localhost:6379/0",
+    backend=os.environ.get("CELERY_RESULT_BACKEND", BROKER_URL or "redis://localhost:6379/0")
+)
+celery_app.conf.task_routes = {
+    "tasks.transcribe_task": {"queue": TRANSCRIPTION_QUEUE},
+    "tasks.*": {"queue": DEFAULT_QUEUE},
+}
+
+
+def celery_enabled():
+    """Whether jobs should be dispatched to the worker queue"""
+    return BROKER_URL is not None
+
+
+# Worker-side service singletons, created lazily so CPU workers never load
+# Whisper weights and vice versa
+_services = {}
+
+
+def _service(name):
+    if name not in _services:
+        if name == 'video_processor':
+            from modules.video_processor import VideoProcessor
+            _services[name] = VideoProcessor()
+        elif name == 'translation':
+            from modules.translation import TranslationService
+            _services[name] = TranslationService()
+        elif name == 'subtitle_handler':
+            from modules.subtitle_handler import SubtitleHandler
+            _services[name] = SubtitleHandler()
+    return _services[name]
+
+
+@celery_app.task(name="tasks.extract_audio_task")
+def extract_audio_task(ctx):
+    ctx['audio_path'] = _service('video_processor').extract_audio(
+        ctx['video_path'],
+        str(Path(ctx['work_dir']) / "audio.wav")
+    )
+    return ctx
+
+
+def _transcription_service(precision):
+    """Transcription singleton keyed by compute type, so a precision
+    picked in the UI reaches the worker instead of the constructor
+    defaults (and switching it builds a new model rather than reusing
+    the previously loaded one)"""
+    key = f"transcription:{precision}"
+    if key not in _services:
+        from modules.transcription import TranscriptionService
+        _services[key] = TranscriptionService(precision=precision)
+    return _services[key]
+
+
+@celery_app.task(name="tasks.transcribe_task")
+def transcribe_task(ctx):
+    ctx['segments'] = _transcription_service(ctx.get('precision', 'int8')).transcribe_audio(
+        ctx['audio_path'],
+        language=ctx.get('language'),
+        chunk_length=ctx.get('chunk_length', 30),
+        batch_size=ctx.get('batch_size', 16)
+    )
+    return ctx
+
+
+@celery_app.task(name="tasks.translate_task")
+def translate_task(ctx):
+    segments = ctx['segments']
+    work_dir = Path(ctx['work_dir'])
+
+    srt_path = work_dir / "subtitles.srt"
+    with open(srt_path, "w", encoding="utf-8") as f:
+        f.write(_service('subtitle_handler').generate_srt(segments))
+    ctx['srt_path'] = str(srt_path)
+    ctx['translated_srt_path'] = str(srt_path)
+
+    if segments and ctx.get('target_language'):
+        translated_segments = _service('translation').translate_segments(
+            segments, ctx['target_language']
+        )
+
+        translated_srt_path = work_dir / "subtitles_translated.srt"
+        with open(translated_srt_path, "w", encoding="utf-8") as f:
+            f.write(_service('subtitle_handler').generate_srt(translated_segments))
+        ctx['translated_srt_path'] = str(translated_srt_path)
+
+    return ctx
+
+
+@celery_app.task(name="tasks.burn_subtitles_task")
+def burn_subtitles_task(ctx):
+    if not ctx['segments']:
+        return ctx
+
+    _service('video_processor').add_subtitles_to_video(
+        ctx['video_path'],
+        ctx['translated_srt_path'],
+        ctx['output_path'],
+        font_size=ctx.get('font_size', 24),
+        font_color=ctx.get('font_color', "#FFFFFF"),
+        outline_color=ctx.get('outline_color', "#000000")
+    )
+    return ctx
+
+
+def run_pipeline(**ctx):
+    """Dispatch the full pipeline for one job; returns the AsyncResult"""
+    return chain(
+        extract_audio_task.s(ctx),
+        transcribe_task.s(),
+        translate_task.s(),
+        burn_subtitles_task.s()
+    ).apply_async()